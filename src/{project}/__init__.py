@@ -1,5 +1,14 @@
-__version__ = "0.1.0"
+from typing import Any
 
 # Shared Typer settings - import in all CLI modules
 # Enables -h as alias for --help (standard convention)
 TYPER_SETTINGS: dict = {"help_option_names": ["-h", "--help"]}
+
+
+def __getattr__(name: str) -> Any:
+    # Expose __version__ without importing _version on package import
+    if name == "__version__":
+        from ._version import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
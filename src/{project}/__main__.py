@@ -0,0 +1,45 @@
+"""Console entry point with a fast path for `version` and `--help`.
+
+These don't need the Typer app, so they are answered without importing
+typer, click or rich. Everything else is dispatched to cli.app.
+"""
+
+import sys
+
+# Static top-level help; keep in sync with the commands registered in cli.py
+HELP = """\
+Usage: {project} [OPTIONS] COMMAND [ARGS]...
+
+  {PROJECT} CLI
+
+Options:
+  -h, --help  Show this message and exit.
+
+Commands:
+  run      Process one or more files.
+  version  Show version.
+  config   Show current configuration.
+  items    Manage items
+
+Run '{project} COMMAND --help' for command options.
+"""
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if args in (["version"], ["--version"]):
+        from ._version import __version__
+
+        sys.stdout.write(f"{__version__}\n")
+        return
+    if args in (["-h"], ["--help"]):
+        sys.stdout.write(HELP)
+        return
+
+    from .cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
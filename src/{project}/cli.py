@@ -1,66 +1,113 @@
+import importlib
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
 
 from . import TYPER_SETTINGS
-from .commands import items
-from .config import load_config
-from .core import process_file
+from .console import emit
+
+if TYPE_CHECKING:
+    import click
+
+# Subcommand groups (modular CLI pattern), imported only when dispatched
+# Usage: {project} items list, {project} items add, etc.
+LAZY_SUBCOMMANDS: dict[str, str] = {
+    "items": ".commands.items",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: "click.Context") -> list[str]:
+        lazy = [name for name in LAZY_SUBCOMMANDS if name not in self.commands]
+        return [*super().list_commands(ctx), *lazy]
+
+    def get_command(self, ctx: "click.Context", cmd_name: str) -> "click.Command | None":
+        module_name = LAZY_SUBCOMMANDS.get(cmd_name)
+        if module_name is None:
+            return super().get_command(ctx, cmd_name)
+        # Build once and mount like add_typer() would (no completion options)
+        if cmd_name not in self.commands:
+            module = importlib.import_module(module_name, __package__)
+            group = typer.main.get_group(module.app)
+            group.name = cmd_name
+            self.add_command(group)
+        return self.commands[cmd_name]
+
 
 app = typer.Typer(
+    cls=LazyGroup,
     help="{PROJECT} CLI",
     no_args_is_help=True,
     context_settings=TYPER_SETTINGS,
 )
-console = Console()
-
-# Mount subcommand groups (modular CLI pattern)
-# Usage: {project} items list, {project} items add, etc.
-app.add_typer(items.app, name="items")
 
 
 @app.command()
 def run(
-    path: Annotated[Path, typer.Argument(help="File to process")],
+    paths: Annotated[list[Path] | None, typer.Argument(help="Files to process")] = None,
+    glob: Annotated[
+        str | None, typer.Option("--glob", "-g", help="Also process files matching this pattern")
+    ] = None,
     output: Annotated[Path | None, typer.Option("--output", "-o", help="Output file")] = None,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Verbose output")] = False,
 ):
-    """Process a file."""
-    config = load_config(verbose=verbose if verbose else None)
-    result = process_file(path, config)
+    """Process one or more files."""
+    from glob import iglob
+
+    from .config import load_config
+    from .core import process_files
+
+    paths = paths or []
+    if glob:
+        # Stdlib glob handles absolute patterns too (Path.glob only takes relative ones)
+        matches = [Path(match) for match in sorted(iglob(glob, recursive=True))]
+        matches = [path for path in matches if path.is_file()]
+        if not matches:
+            raise typer.BadParameter(f"Pattern {glob!r} matched no files", param_hint="'--glob'")
+        paths += matches
+    if not paths:
+        raise typer.BadParameter("Pass at least one file or a --glob pattern")
+
+    config = load_config(verbose=verbose or None)
+    results = process_files(paths, config)
 
     if output:
-        output.write_text(result)
-        console.print(f"[green]Written to:[/green] {output}")
+        output.write_text("".join(results))
+        emit(("Written to: ", "green"), str(output))
     else:
-        console.print(result)
+        for result in results:
+            emit(result)
 
 
 @app.command()
 def version():
     """Show version."""
-    from . import __version__
+    from ._version import __version__
 
-    console.print(f"{__version__}")
+    emit(__version__)
 
 
 @app.command(name="config")
 def show_config():
     """Show current configuration."""
+    from dataclasses import asdict
+
     from .config import get_config_dir, load_config
 
     config = load_config()
     config_dir = get_config_dir()
 
-    console.print(f"[dim]Config dir:[/dim] {config_dir}")
-    console.print(f"[dim]Default:[/dim]   {config_dir / 'default.toml'}")
-    console.print(f"[dim]Local:[/dim]     {config_dir / 'local.toml'}")
-    console.print()
-    console.print("[bold]Current config:[/bold]")
-    for key, value in config.model_dump().items():
-        console.print(f"  {key}: {value}")
+    emit(("Config dir: ", "dim"), str(config_dir))
+    emit(("Default:    ", "dim"), str(config_dir / "default.toml"))
+    emit(("Local:      ", "dim"), str(config_dir / "local.toml"))
+    emit()
+    emit(("Current config:", "bold"))
+    for key, value in asdict(config).items():
+        emit(f"  {key}: {value}")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 """Subcommand modules for modular CLI structure.
 
-Each module exports a Typer app that gets mounted in cli.py via add_typer().
+Each module exports a Typer app that gets mounted in cli.py via LAZY_SUBCOMMANDS,
+so it is only imported when its group is invoked.
 """
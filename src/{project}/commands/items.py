@@ -1,19 +1,23 @@
 """Items subcommands: {project} items list|add|remove
 
-Example of modular CLI using Typer's add_typer() pattern.
+Example of modular CLI; mounted lazily via LAZY_SUBCOMMANDS in cli.py.
 Each command group lives in its own file under commands/.
 """
 
+import sys
 from typing import Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from .. import TYPER_SETTINGS
+from ..console import emit, get_console, is_terminal
 
 app = typer.Typer(help="Manage items", context_settings=TYPER_SETTINGS)
-console = Console()
+
+# Example data, one list per column - replace with actual logic
+ITEM_IDS = ["1"]
+ITEM_NAMES = ["Example item"]
+ITEM_DETAILS = ["Details here"]
 
 
 @app.command()
@@ -21,16 +25,28 @@ def list(
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show details")] = False,
 ):
     """List all items."""
-    table = Table(title="Items")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name")
+    columns = {"ID": ITEM_IDS, "Name": ITEM_NAMES}
     if verbose:
-        table.add_column("Details")
+        columns["Details"] = ITEM_DETAILS
+    # Lazily zipped, so unrequested columns are never touched
+    rows = zip(*columns.values(), strict=True)
+
+    if not is_terminal():
+        # Stream plain tab-separated rows for pipes and scripts
+        print("\t".join(columns))
+        for row in rows:
+            print("\t".join(row))
+        return
 
-    # Example data - replace with actual logic
-    table.add_row("1", "Example item", "Details here" if verbose else None)
+    from rich.table import Table
+
+    table = Table(title="Items")
+    for column in columns:
+        table.add_column(column, style="cyan" if column == "ID" else None)
+    for row in rows:
+        table.add_row(*row)
 
-    console.print(table)
+    get_console().print(table)
 
 
 @app.command()
@@ -38,7 +54,7 @@ def add(
     name: Annotated[str, typer.Argument(help="Item name")],
 ):
     """Add a new item."""
-    console.print(f"[green]Added:[/green] {name}")
+    emit(("Added: ", "green"), name)
 
 
 @app.command()
@@ -48,8 +64,10 @@ def remove(
 ):
     """Remove an item."""
     if not force:
-        confirm = typer.confirm(f"Remove item {item_id}?")
-        if not confirm:
+        # Plain stdin prompt, avoids Click's prompt machinery
+        sys.stdout.write(f"Remove item {item_id}? [y/N]: ")
+        sys.stdout.flush()
+        if sys.stdin.readline().strip().lower() not in ("y", "yes"):
             raise typer.Abort()
 
-    console.print(f"[red]Removed:[/red] {item_id}")
+    emit(("Removed: ", "red"), item_id)
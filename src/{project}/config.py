@@ -7,19 +7,55 @@ Priority (highest to lowest):
 4. config/default.toml (versioned defaults)
 """
 
+import copy
+import hashlib
+import json
 import os
 import tomllib
+from collections.abc import Callable
+from dataclasses import fields
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 from .models import Config
 
 
+def parse_bool(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes")
+
+
+ROOT_MARKERS = ("pyproject.toml", ".git")
+CONFIG_FIELDS = frozenset(field.name for field in fields(Config))
+ENV_PREFIX = "{PROJECT}_".upper()
+ENV_PARSERS: dict[type, Callable[[str], Any]] = {bool: parse_bool, int: int, str: str}
+
+# Env var name -> (config field, parser), derived from Config's scalar fields
+ENV_MAP: dict[str, tuple[str, Callable[[str], Any]]] = {
+    f"{ENV_PREFIX}{field.name.upper()}": (field.name, ENV_PARSERS[field.type])
+    for field in fields(Config)
+    if field.type in ENV_PARSERS
+}
+
+# Parsed 'general' section of the TOML files, reused across runs while they are unchanged
+CACHE_FILE = ".config.cache"
+
+# Loaded configs keyed by config dir, config file mtimes, CLI overrides and env overrides
+_CACHE: dict[tuple[Any, ...], Config] = {}
+
+
 def find_project_root() -> Path:
     """Find project root by looking for pyproject.toml or .git."""
-    current = Path.cwd()
-    for parent in [current, *current.parents]:
-        if (parent / "pyproject.toml").exists() or (parent / ".git").exists():
+    return _find_project_root(os.getcwd())
+
+
+@lru_cache(maxsize=1)
+def _find_project_root(cwd: str) -> Path:
+    current = Path(cwd)
+    for parent in chain((current,), current.parents):
+        # One stat per marker, stopping at the first hit
+        if any((parent / marker).exists() for marker in ROOT_MARKERS):
             return parent
     return current
 
@@ -31,23 +67,90 @@ def get_config_dir() -> Path:
 
 def load_toml(path: Path) -> dict[str, Any]:
     """Load a TOML file, returning empty dict if not found."""
-    if not path.exists():
+    try:
+        return tomllib.loads(path.read_bytes().decode("utf-8"))
+    except FileNotFoundError:
         return {}
-    with path.open("rb") as f:
-        return tomllib.load(f)
+
+
+def mtime_ns(path: Path) -> int:
+    """Get a file's modification time in nanoseconds, 0 if not found."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
 
 
 def merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Deep merge override into base."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    """Deep merge override into base (base is returned as-is if override is empty)."""
+    if not override:
+        return base
+
+    result = copy.deepcopy(base)
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
     return result
 
 
+def file_digest(path: Path) -> str:
+    """Get a BLAKE2b hex digest of a file's contents, empty if not found."""
+    try:
+        return hashlib.blake2b(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+def read_cache(cache_path: Path) -> dict[str, Any]:
+    """Read config/.config.cache, returning empty dict if missing or malformed."""
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or not isinstance(cache.get("general"), dict):
+        return {}
+    return cache
+
+
+def load_general_section(config_dir: Path, mtimes: tuple[int, int]) -> dict[str, Any]:
+    """Load the merged 'general' section of default.toml + local.toml.
+
+    The result is saved as JSON to config/.config.cache together with the files' mtimes
+    and digests. Later runs reuse it when the mtimes match, or when only the mtimes
+    changed (e.g. after a checkout) and the digests still match.
+    """
+    paths = (config_dir / "default.toml", config_dir / "local.toml")
+    cache_path = config_dir / CACHE_FILE
+    cache = read_cache(cache_path)
+    if cache.get("mtimes") == list(mtimes):
+        return cache["general"]
+
+    digests = [file_digest(path) for path in paths]
+    if cache.get("digests") == digests:
+        section = cache["general"]
+    else:
+        # Load defaults, then local overrides
+        section = merge_dicts(*(load_toml(path) for path in paths)).get("general", {})
+
+    # Only cache inside a real config dir, never one without default.toml
+    if digests[0]:
+        tmp_path = cache_path.with_name(f"{CACHE_FILE}.{os.getpid()}")
+        try:
+            data = json.dumps({"mtimes": list(mtimes), "digests": digests, "general": section})
+            tmp_path.write_text(data)
+            tmp_path.replace(cache_path)
+        except (OSError, TypeError):
+            # Read-only checkout or non-JSON values (e.g. dates): skip the cache
+            tmp_path.unlink(missing_ok=True)
+    return section
+
+
 def load_config(**cli_overrides: Any) -> Config:
     """Load configuration with priority: CLI > env > local.toml > default.toml.
 
@@ -55,32 +158,43 @@ def load_config(**cli_overrides: Any) -> Config:
         **cli_overrides: CLI argument overrides (e.g., verbose=True)
 
     Returns:
-        Merged Config object
+        Merged Config object (frozen, shared until a config file changes)
     """
     config_dir = get_config_dir()
-
-    # Load defaults, then local overrides
-    defaults = load_toml(config_dir / "default.toml")
-    local = load_toml(config_dir / "local.toml")
-    merged = merge_dicts(defaults, local)
-
-    # Extract the 'general' section as flat config
-    config_data = merged.get("general", {})
+    mtimes = (mtime_ns(config_dir / "default.toml"), mtime_ns(config_dir / "local.toml"))
+    # Lists become tuples so overrides can be part of the cache key
+    cli_overrides = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in cli_overrides.items()
+        if value is not None
+    }
+    env_overrides = {env_key: os.environ[env_key] for env_key in os.environ.keys() & ENV_MAP.keys()}
+
+    # Common case: no overrides, so the config only depends on the config files
+    cache_key: tuple[Any, ...] | None = (config_dir, mtimes)
+    if cli_overrides or env_overrides:
+        cache_key += (frozenset(cli_overrides.items()), frozenset(env_overrides.items()))
+    try:
+        cached = _CACHE.get(cache_key)
+    except TypeError:  # other unhashable override values: skip the cache
+        cache_key = None
+        cached = None
+    if cached:
+        return cached
+
+    # Extract the 'general' section as flat config, ignoring unknown keys
+    section = load_general_section(config_dir, mtimes)
+    config_data = {key: value for key, value in section.items() if key in CONFIG_FIELDS}
 
     # Apply environment variable overrides
-    env_prefix = "{PROJECT}_".upper()
-    for key in ["verbose", "timeout"]:
-        env_key = f"{env_prefix}{key.upper()}"
-        if env_key in os.environ:
-            value = os.environ[env_key]
-            if key == "verbose":
-                config_data[key] = value.lower() in ("1", "true", "yes")
-            elif key == "timeout":
-                config_data[key] = int(value)
+    for env_key, value in env_overrides.items():
+        key, parse = ENV_MAP[env_key]
+        config_data[key] = parse(value)
 
     # Apply CLI overrides (highest priority)
-    for key, value in cli_overrides.items():
-        if value is not None:
-            config_data[key] = value
+    config_data.update(cli_overrides)
 
-    return Config(**config_data)
+    config = Config(**config_data)
+    if cache_key is not None:
+        _CACHE[cache_key] = config
+    return config
@@ -0,0 +1,38 @@
+"""Terminal output: Rich when stdout is a terminal, plain print() otherwise.
+
+Piped and scripted invocations never import Rich.
+"""
+
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    from rich.console import Console
+
+    return Console()
+
+
+def is_terminal() -> bool:
+    return sys.stdout.isatty()
+
+
+def emit(*parts: str | tuple[str, str]) -> None:
+    """Print a line from plain strings and (text, style) pairs.
+
+    Styles are applied directly rather than parsed from markup, so text is always literal.
+
+    Example:
+        emit(("Added: ", "green"), name)
+    """
+    if is_terminal():
+        from rich.text import Text
+
+        get_console().print(Text.assemble(*parts))
+    else:
+        print("".join(part if isinstance(part, str) else part[0] for part in parts))
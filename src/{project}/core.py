@@ -1,15 +1,51 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from .models import Config
 
+# Files at or above this size are read in config.read_buffer sized chunks
+LARGE_FILE_SIZE = 1024 * 1024
+
 
 def process_file(path: Path, config: Config) -> str:
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    try:
+        f = path.open("rb", buffering=0)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {path}") from e
 
-    content = path.read_text()
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size < LARGE_FILE_SIZE:
+            content = f.readall().decode("utf-8")
+        else:
+            content = read_chunked(f, size, config.read_buffer).decode("utf-8")
 
     if config.verbose:
         print(f"Processing {path} ({len(content)} bytes)")
 
     return content
+
+
+def read_chunked(f: io.RawIOBase, size: int, chunk_size: int) -> bytearray:
+    """Read a file of known size into one preallocated buffer, chunk_size bytes per read."""
+    data = bytearray(size)
+    offset = 0
+    with memoryview(data) as view:
+        while offset < size and (n := f.readinto(view[offset : offset + chunk_size])):
+            offset += n
+    if offset < size:
+        del data[offset:]  # file shrank since fstat
+    else:
+        data += f.readall()  # or grew
+    return data
+
+
+def process_files(paths: list[Path], config: Config) -> list[str]:
+    """Process files concurrently on threads (reads release the GIL), keeping input order."""
+    if len(paths) <= 1:
+        return [process_file(path, config) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return list(executor.map(partial(process_file, config=config), paths))
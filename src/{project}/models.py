@@ -1,7 +1,22 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, fields
 
 
-class Config(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Config:
     verbose: bool = False
     timeout: int = 30
-    tags: list[str] = Field(default_factory=list)
+    tags: tuple[str, ...] = ()
+    read_buffer: int = 128 * 1024
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.tags, list | tuple) or not all(
+            isinstance(tag, str) for tag in self.tags
+        ):
+            raise TypeError("Config.tags must be a list of str")
+        # TOML arrays load as lists; store a tuple so cached configs stay immutable
+        object.__setattr__(self, "tags", tuple(self.tags))
+        for field in fields(self):
+            if field.type in (bool, int) and type(getattr(self, field.name)) is not field.type:
+                raise TypeError(f"Config.{field.name} must be {field.type.__name__}")
+        if self.read_buffer <= 0:
+            raise ValueError("Config.read_buffer must be positive")
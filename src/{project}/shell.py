@@ -27,13 +27,17 @@ Usage:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-import sh as _sh
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    import sh
     from sh import Command
 
+    # Resolved lazily by __getattr__ below
+    rm: Command
+    rg: Command | None
+    fd: Command | None
+
 __all__ = [
     "sh",
     "rm",
@@ -43,18 +47,16 @@ __all__ = [
     "command",
 ]
 
-# Re-export sh for direct access to any command
-sh = _sh
 
-
-def command(name: str) -> "Command":
+def command(name: str) -> Command:
     """Get a command by name, raising helpful error if not found."""
+    import sh
+
     try:
-        return _sh.Command(name)
-    except _sh.CommandNotFound:
+        return sh.Command(name)
+    except sh.CommandNotFound:
         raise RuntimeError(
-            f"Command '{name}' not found in PATH. "
-            f"Install it or check your environment."
+            f"Command '{name}' not found in PATH. Install it or check your environment."
         ) from None
 
 
@@ -76,30 +78,44 @@ def run(cmd: str, *args: str, **kwargs) -> str:
     return command(cmd)(*args, **kwargs)
 
 
-# Safe rm using rip (sends to trash instead of permanent delete)
-# Install: cargo install rm-improved
-try:
-    rm: "Command" = _sh.rip
-except _sh.CommandNotFound:
+def _rip_not_found(*args, **kwargs):
     # Fallback warning - don't silently use rm
-    def rm(*args, **kwargs):
-        raise RuntimeError(
-            "rip not found. Install with: cargo install rm-improved\n"
-            "Or use sh.rm directly if you want permanent deletion."
-        )
-
-
-# ripgrep - fast grep alternative
-# Install: cargo install ripgrep (or: brew install ripgrep)
-try:
-    rg: "Command" = _sh.rg
-except _sh.CommandNotFound:
-    rg = None  # type: ignore
+    raise RuntimeError(
+        "rip not found. Install with: cargo install rm-improved\n"
+        "Or use sh.rm directly if you want permanent deletion."
+    )
+
+
+# Lazily resolved attributes: name -> (executable, fallback if not in PATH)
+_COMMANDS: dict[str, tuple[str, Any]] = {
+    # Safe rm using rip (sends to trash instead of permanent delete)
+    # Install: cargo install rm-improved
+    "rm": ("rip", _rip_not_found),
+    # ripgrep - fast grep alternative
+    # Install: cargo install ripgrep (or: brew install ripgrep)
+    "rg": ("rg", None),
+    # fd - fast find alternative
+    # Install: cargo install fd-find (or: brew install fd)
+    "fd": ("fd", None),
+}
+
+
+def _resolve(name: str) -> Any:
+    import sh
+
+    # Re-export sh for direct access to any command
+    if name == "sh":
+        return sh
+    executable, fallback = _COMMANDS[name]
+    try:
+        return sh.Command(executable)
+    except sh.CommandNotFound:
+        return fallback
 
 
-# fd - fast find alternative
-# Install: cargo install fd-find (or: brew install fd)
-try:
-    fd: "Command" = _sh.fd
-except _sh.CommandNotFound:
-    fd = None  # type: ignore
+def __getattr__(name: str) -> Any:
+    """Import sh and look up commands in PATH on first access, not at import."""
+    if name != "sh" and name not in _COMMANDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = _resolve(name)
+    return value
@@ -1,17 +1,40 @@
+import os
 from pathlib import Path
 
 import pytest
+import typer
+
+
+@pytest.fixture(scope="session")
+def cli_app() -> typer.Typer:
+    from {project}.cli import app
+
+    return app
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "pyproject.toml").write_text("")
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "default.toml").write_text("[general]\ntimeout = 10\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 @pytest.fixture
 def sample_file(tmp_path: Path) -> Path:
     f = tmp_path / "sample.txt"
-    f.write_text("test content")
+    # Raw write, skips the TextIOWrapper that write_text() sets up per fixture
+    fd = os.open(f, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"test content")
+    finally:
+        os.close(fd)
     return f
 
 
 @pytest.fixture
 def empty_file(tmp_path: Path) -> Path:
     f = tmp_path / "empty.txt"
-    f.write_text("")
+    f.touch()
     return f
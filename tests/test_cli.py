@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from {project}.__main__ import HELP
+from {project}._version import __version__
+
+
+def test_static_help_lists_all_commands(cli_app: typer.Typer):
+    command = typer.main.get_command(cli_app)
+    with typer.Context(command) as ctx:
+        names = command.list_commands(ctx)
+    for name in names:
+        assert f"  {name} " in HELP
+
+
+def test_lazy_group_has_no_completion_options(cli_app: typer.Typer):
+    command = typer.main.get_command(cli_app)
+    with typer.Context(command) as ctx:
+        items = command.get_command(ctx, "items")
+        assert command.get_command(ctx, "items") is items
+        assert command.list_commands(ctx).count("items") == 1
+    assert "--install-completion" not in [opt for p in items.params for opt in p.opts]
+
+
+def test_items_list_piped_output(cli_app: typer.Typer):
+    result = CliRunner().invoke(cli_app, ["items", "list", "--verbose"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["ID\tName\tDetails", "1\tExample item\tDetails here"]
+
+
+def test_items_remove_confirmed(cli_app: typer.Typer):
+    result = CliRunner().invoke(cli_app, ["items", "remove", "1"], input="y\n")
+    assert result.exit_code == 0
+    assert "Removed: 1" in result.output
+
+
+def test_items_remove_declined(cli_app: typer.Typer):
+    result = CliRunner().invoke(cli_app, ["items", "remove", "1"], input="\n")
+    assert result.exit_code == 1
+    assert "Removed" not in result.output
+
+
+@pytest.fixture
+def text_files(project_dir: Path) -> list[Path]:
+    paths = [project_dir / "a.txt", project_dir / "b.txt"]
+    for path in paths:
+        path.write_text(f"{path.stem}\n")
+    return paths
+
+
+def test_run_multiple_paths(cli_app: typer.Typer, text_files: list[Path]):
+    result = CliRunner().invoke(cli_app, ["run", *map(str, text_files)])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["a", "", "b", ""]
+
+
+def test_run_output_concatenates(cli_app: typer.Typer, text_files: list[Path], tmp_path: Path):
+    output = tmp_path / "out.txt"
+    result = CliRunner().invoke(cli_app, ["run", *map(str, text_files), "-o", str(output)])
+    assert result.exit_code == 0
+    assert output.read_text() == "a\nb\n"
+
+
+def test_run_relative_glob(cli_app: typer.Typer, text_files: list[Path], tmp_path: Path):
+    output = tmp_path / "out.txt"
+    result = CliRunner().invoke(cli_app, ["run", "--glob", "*.txt", "-o", str(output)])
+    assert result.exit_code == 0
+    assert output.read_text() == "a\nb\n"
+
+
+def test_run_absolute_glob(cli_app: typer.Typer, text_files: list[Path], tmp_path: Path):
+    output = tmp_path / "out.log"
+    pattern = str(tmp_path / "*.txt")
+    result = CliRunner().invoke(cli_app, ["run", "--glob", pattern, "-o", str(output)])
+    assert result.exit_code == 0
+    assert output.read_text() == "a\nb\n"
+
+
+def test_run_glob_without_matches(cli_app: typer.Typer, project_dir: Path, tmp_path: Path):
+    result = CliRunner().invoke(cli_app, ["run", "--glob", str(tmp_path / "*.none")])
+    assert result.exit_code == 2
+    assert "matched no files" in result.output
+
+
+def test_run_without_paths(cli_app: typer.Typer, project_dir: Path):
+    result = CliRunner().invoke(cli_app, ["run"])
+    assert result.exit_code == 2
+
+
+def test_version(cli_app: typer.Typer):
+    result = CliRunner().invoke(cli_app, ["version"])
+    assert result.exit_code == 0
+    assert result.output == f"{__version__}\n"
+
+
+def test_show_config(cli_app: typer.Typer, project_dir: Path):
+    result = CliRunner().invoke(cli_app, ["config"])
+    assert result.exit_code == 0
+    assert f"Config dir: {project_dir / 'config'}" in result.output
+    assert "timeout: 10" in result.output
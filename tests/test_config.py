@@ -0,0 +1,82 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from {project}.config import find_project_root, load_config, merge_dicts
+
+
+def test_merge_dicts_nested():
+    base = {"general": {"verbose": False, "timeout": 30}, "other": {"key": "a"}}
+    override = {"general": {"timeout": 5}, "new": 1}
+    merged = merge_dicts(base, override)
+    assert merged == {
+        "general": {"verbose": False, "timeout": 5},
+        "other": {"key": "a"},
+        "new": 1,
+    }
+    assert base["general"]["timeout"] == 30
+
+
+def test_find_project_root_from_subdir(project_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    subdir = project_dir / "a" / "b"
+    subdir.mkdir(parents=True)
+    monkeypatch.chdir(subdir)
+    assert find_project_root() == project_dir
+
+
+def test_load_config_defaults(project_dir: Path):
+    config = load_config()
+    assert config.timeout == 10
+    assert config.verbose is False
+
+
+def test_load_config_ignores_unknown_keys(project_dir: Path):
+    (project_dir / "config" / "local.toml").write_text('[general]\nunknown = 1\ntags = ["a"]\n')
+    config = load_config()
+    assert config.tags == ("a",)
+    assert not hasattr(config, "unknown")
+
+
+def test_load_config_cli_override(project_dir: Path):
+    assert load_config(verbose=True).verbose is True
+    assert load_config(verbose=None).verbose is False
+
+
+def test_load_config_list_override(project_dir: Path):
+    assert load_config(tags=["a", "b"]).tags == ("a", "b")
+    assert load_config(tags=["a", "b"]).tags == ("a", "b")
+
+
+def test_load_config_env_override(project_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("{PROJECT}_TIMEOUT", "99")
+    monkeypatch.setenv("{PROJECT}_VERBOSE", "yes")
+    config = load_config()
+    assert config.timeout == 99
+    assert config.verbose is True
+
+
+def test_load_config_reloads_changed_file(project_dir: Path):
+    assert load_config().timeout == 10
+
+    default = project_dir / "config" / "default.toml"
+    default.write_text("[general]\ntimeout = 20\n")
+    os.utime(default, ns=(1, 1))
+    assert load_config().timeout == 20
+
+
+def test_load_config_writes_disk_cache(project_dir: Path):
+    load_config()
+    assert (project_dir / "config" / ".config.cache").exists()
+
+
+@pytest.mark.parametrize("content", [b"not json", b"[]", b'{"general": 1}'])
+def test_load_config_ignores_malformed_disk_cache(project_dir: Path, content: bytes):
+    (project_dir / "config" / ".config.cache").write_bytes(content)
+    assert load_config().timeout == 10
+
+
+def test_load_config_skips_disk_cache_without_default_toml(project_dir: Path):
+    (project_dir / "config" / "default.toml").unlink()
+    assert load_config().timeout == 30
+    assert not (project_dir / "config" / ".config.cache").exists()
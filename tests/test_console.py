@@ -0,0 +1,16 @@
+import pytest
+
+from {project}.console import emit
+
+
+@pytest.mark.parametrize(
+    "parts,expected",
+    [
+        ((("Added: ", "green"), "foo"), "Added: foo"),
+        (("[green]literal[/green]",), "[green]literal[/green]"),
+        ((), ""),
+    ],
+)
+def test_emit_plain_when_piped(parts: tuple, expected: str, capsys):
+    emit(*parts)
+    assert capsys.readouterr().out == f"{expected}\n"
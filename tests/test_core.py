@@ -1,8 +1,9 @@
+import io
 from pathlib import Path
 
 import pytest
 
-from {project}.core import process_file
+from {project}.core import process_file, process_files, read_chunked
 from {project}.models import Config
 
 
@@ -23,3 +24,59 @@ def test_process_file_verbose(sample_file: Path, capsys):
     process_file(sample_file, config)
     captured = capsys.readouterr()
     assert "Processing" in captured.out
+
+
+def test_process_file_large(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("{project}.core.LARGE_FILE_SIZE", 8)
+    f = tmp_path / "large.txt"
+    f.write_bytes("héllo wörld".encode() * 1000)
+    assert process_file(f, Config()) == "héllo wörld" * 1000
+
+
+class RecordingReader(io.RawIOBase):
+    def __init__(self, data: bytes):
+        self.source = io.BytesIO(data)
+        self.read_sizes: list[int] = []
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        self.read_sizes.append(len(buffer))
+        return self.source.readinto(buffer)
+
+
+def test_read_chunked_uses_chunk_size():
+    reader = RecordingReader(b"x" * 10)
+    assert read_chunked(reader, 10, 4) == b"x" * 10
+    assert reader.read_sizes[:3] == [4, 4, 2]
+
+
+@pytest.mark.parametrize("actual,expected_size", [(b"x" * 6, 10), (b"x" * 12, 10)])
+def test_read_chunked_handles_size_change(actual: bytes, expected_size: int):
+    assert read_chunked(RecordingReader(actual), expected_size, 4) == actual
+
+
+def test_config_rejects_non_positive_read_buffer():
+    with pytest.raises(ValueError):
+        Config(read_buffer=0)
+
+
+def test_process_files_keeps_order(tmp_path: Path):
+    paths = []
+    for i in range(5):
+        f = tmp_path / f"file{i}.txt"
+        f.write_text(f"content {i}")
+        paths.append(f)
+    assert process_files(paths, Config()) == [f"content {i}" for i in range(5)]
+
+
+def test_process_files_not_found(sample_file: Path, tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        process_files([sample_file, tmp_path / "nonexistent.txt"], Config())
+
+
+@pytest.mark.parametrize("tags", ["abc", ["a", 1], None])
+def test_config_rejects_invalid_tags(tags):
+    with pytest.raises(TypeError):
+        Config(tags=tags)